@@ -11,137 +11,322 @@ Usage:
 
 import argparse
 import asyncio
+import dbm
+import logging
+import logging.handlers
 import os
+import pickle
+import queue
 import re
+import shelve
 import sys
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, Optional, Set, Tuple, Union
 from urllib.parse import urlparse, urljoin
 
-from playwright.async_api import async_playwright, Page
-from bs4 import BeautifulSoup, Comment
+import aiofiles
+import httpx
+from tqdm import tqdm
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Error as PlaywrightError, Page, Playwright, Route
+)
+from bs4 import BeautifulSoup, Comment, Tag
 import markdownify
 
 
+logger = logging.getLogger('api2md')
+
+# Precompiled patterns used on every scraped page
+_METHOD_RE = re.compile(r'\b(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\b', re.I)
+# A verb directly followed by a path ("post /v1/customers") is preferred over
+# a bare verb, which may just be prose ("get a user")
+_METHOD_PATH_RE = re.compile(r'\b(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\b(?=\s+`?/)', re.I)
+_METHOD_SCAN_LIMIT = 16 * 1024
+_PATH_RES = [
+    re.compile(r'/api/[^"\s<>]+'),
+    re.compile(r'/v\d+/[^"\s<>]+'),
+    re.compile(r'https?://[^/]+(/[^"\s<>]+)'),
+    re.compile(r'[^"\s<>]*(/[a-zA-Z0-9_\-/{}]+)'),
+]
+_ENDPOINT_SCAN_LIMIT = 64 * 1024
+_ENDPOINT_CLEAN_RE = re.compile(r'[^\w\-/{}]')
+_FILENAME_CLEAN_RE = re.compile(r'[^\w\-]')
+_DASH_COLLAPSE_RE = re.compile(r'-+')
+_BLANKLINE_RE = re.compile(r'\n{3,}')
+
+# Page chrome stripped before conversion
+_REMOVE_SELECTOR = ', '.join([
+    'nav', 'header', 'footer', '.nav', '.navbar', '.header', '.footer',
+    '.sidebar', '.menu', '.breadcrumb', '.pagination', 'aside',
+    'script', 'style', 'noscript'
+])
+
+# Main content containers, in priority order
+_CONTENT_SELECTORS = [
+    'main', '.content', '.main-content', '.documentation',
+    '.api-docs', '.doc-content', 'article', '.article',
+    '#content', '#main', '#documentation'
+]
+_CONTENT_SELECTOR = ', '.join(_CONTENT_SELECTORS)
+
+# Content containers of documentation hosts with a stable layout; matched
+# against the URL's host and its parent domains
+_HOST_CONTENT_SELECTORS = {
+    'docs.python.org': 'div.body[role="main"]',
+    'readthedocs.io': 'div[role="main"]',
+    'readthedocs.org': 'div[role="main"]',
+    'developer.mozilla.org': 'article.main-page-content',
+}
+_HOST_RE = re.compile(
+    r'(?:^|\.)(' + '|'.join(map(re.escape, _HOST_CONTENT_SELECTORS)) + r')(?::\d+)?$'
+)
+
+# Markers of client-rendered pages that must go through the browser
+_SPA_MARKERS = (
+    b'id="__NEXT_DATA__"', b'window.__NUXT__', b'<redoc', b'swagger-ui',
+    b'<div id="root"></div>', b'<div id="app"></div>'
+)
+# Statically fetched pages with less text than this are re-rendered in the browser
+_MIN_STATIC_TEXT = 500
+
+# Shared HTML -> Markdown converter; it keeps no per-document state
+_MARKDOWN_CONVERTER = markdownify.MarkdownConverter(
+    strip=['script', 'style', 'meta', 'link', 'noscript'],
+    heading_style='ATX'
+)
+
+# URLs with these suffixes are downloads or assets, never documentation pages
+_SKIPPED_EXTENSIONS = (
+    '.pdf', '.zip', '.gz', '.tar', '.png', '.jpg', '.jpeg', '.gif', '.svg',
+    '.ico', '.mp4', '.exe', '.dmg'
+)
+
+# Browser network errors that mean the whole host is unreachable; anything
+# else (timeouts, resets, redirect loops...) only fails the one URL
+_HOST_FAILURE_ERRORS = (
+    'net::ERR_NAME_NOT_RESOLVED', 'net::ERR_NAME_RESOLUTION_FAILED',
+    'net::ERR_CONNECTION_REFUSED', 'net::ERR_ADDRESS_UNREACHABLE'
+)
+
+# Validator cache shared across runs; lives outside the Markdown output
+_DEFAULT_CACHE_PATH = os.path.join(os.path.expanduser('~'), '.cache', 'api2md', 'pages')
+# Failures of the cache file itself (unwritable, locked, corrupt index or
+# entries); they disable caching instead of failing pages
+_CACHE_ERRORS = (OSError, ValueError, SyntaxError, EOFError, pickle.UnpicklingError, *dbm.error)
+
+# Resource types the browser never needs to fetch for text extraction
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+
 class APIDocConverter:
     """Main converter class for API documentation to Markdown"""
     
-    def __init__(self, output_dir: str = './output'):
+    _USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    
+    # Common selectors for expand buttons; text-based matches are handled
+    # in _EXPAND_SCRIPT so the whole pass is a single round-trip
+    _EXPAND_SELECTORS = ', '.join([
+        'button[aria-expanded="false"]',
+        '.expand-all',
+        '[data-toggle="collapse"]',
+        '.collapse-toggle',
+        '.accordion-toggle',
+        '[aria-label*="expand" i]',
+        '[title*="expand" i]',
+        '.btn-expand'
+    ])
+    
+    _EXPAND_SCRIPT = """(selectors) => {
+        document.querySelectorAll('details:not([open])')
+            .forEach(d => d.setAttribute('open', ''));
+        // Expand-all controls go first so individual toggles are not undone
+        const targets = new Set(document.querySelectorAll('.expand-all'));
+        document.querySelectorAll(selectors).forEach(el => targets.add(el));
+        document.querySelectorAll('button, a').forEach(el => {
+            const pattern = el.tagName === 'BUTTON' ? /expand|show/i : /expand/i;
+            if (pattern.test(el.textContent)) targets.add(el);
+        });
+        targets.forEach(el => {
+            // State is checked at click time: an earlier click may have
+            // already expanded (or removed) this element
+            if (!el.isConnected || el.getAttribute('aria-expanded') === 'true') return;
+            try { el.click(); } catch (e) {}
+        });
+    }"""
+    
+    def __init__(self, output_dir: str = './output', cache_path: Optional[str] = None):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
+        # Plain string form for building per-URL paths without pathlib overhead
+        self._out = os.fspath(self.output_dir)
+        
+        # (output dir, URL) -> (conditional request headers, markdown path) from
+        # previous runs. Opened by convert_urls if it exists, otherwise created
+        # on the first saved page
+        self.cache_path = cache_path or _DEFAULT_CACHE_PATH
+        self.cache: Optional[shelve.Shelf] = None
+        self.cache_disabled = False
+        self.http: Optional[httpx.AsyncClient] = None
+        
+        # Hosts that could not be reached (DNS failure, refused connection...) this run
+        self.failed_hosts: Set[str] = set()
+        
+        # Browser state, only started once a page actually needs rendering
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+        self._context: Optional[BrowserContext] = None
+        self._browser_lock: Optional[asyncio.Lock] = None
+    
+    def _cache_key(self, url: str) -> str:
+        """Cache key for a URL; entries are kept per output directory"""
+        return f"{os.path.abspath(self._out)} {url}"
+    
+    def _open_cache(self, create: bool) -> None:
+        """Open the cache, creating it if ``create``; disables caching on failure"""
+        if self.cache is not None or self.cache_disabled:
+            return
+        try:
+            if create:
+                os.makedirs(os.path.dirname(os.path.abspath(self.cache_path)), exist_ok=True)
+            elif dbm.whichdb(self.cache_path) is None:
+                return
+            self.cache = shelve.open(self.cache_path)
+        except _CACHE_ERRORS as e:
+            self._disable_cache(e)
+    
+    def _disable_cache(self, error: Exception) -> None:
+        """Stop using the cache for the rest of the run, warning once"""
+        if not self.cache_disabled:
+            logger.warning(f"Warning: page cache '{self.cache_path}' unavailable, continuing without it: {error}")
+        self.cache_disabled = True
+        self._close_cache()
+    
+    def _close_cache(self) -> None:
+        """Close the cache, ignoring errors from a broken cache file"""
+        if self.cache is not None:
+            try:
+                self.cache.close()
+            except _CACHE_ERRORS:
+                pass
+        self.cache = None
+    
+    def cached_result(self, url: str) -> Optional[Tuple[Dict[str, str], str]]:
+        """Return the validator headers and file from a previous run, if the file exists"""
+        if self.cache is None:
+            return None
+        try:
+            entry = self.cache.get(self._cache_key(url))
+        except _CACHE_ERRORS as e:
+            self._disable_cache(e)
+            return None
+        if entry and os.path.exists(entry[1]):
+            return entry
+        return None
+    
+    @staticmethod
+    def validator_headers(response: httpx.Response) -> Dict[str, str]:
+        """Conditional request headers that revalidate the given response"""
+        if 'etag' in response.headers:
+            return {'If-None-Match': response.headers['etag']}
+        if 'last-modified' in response.headers:
+            return {'If-Modified-Since': response.headers['last-modified']}
+        return {}
+    
+    def remember_result(self, url: str, validator: Dict[str, str], filepath: str) -> None:
+        """Record the file written for a URL, creating the cache on first use"""
+        self._open_cache(create=True)
+        if self.cache is None:
+            return
+        try:
+            self.cache[self._cache_key(url)] = (validator, filepath)
+        except _CACHE_ERRORS as e:
+            self._disable_cache(e)
+    
+    @staticmethod
+    async def _block_heavy_resources(route: Route) -> None:
+        """Abort requests for images, media, fonts and stylesheets"""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def expand_collapsibles(self, page: Page) -> None:
         """Expand all collapsible sections on the page"""
         try:
-            # Common selectors for expand buttons
-            expand_selectors = [
-                'button[aria-expanded="false"]',
-                '.expand-all',
-                '[data-toggle="collapse"]',
-                '.collapse-toggle',
-                'details:not([open])',
-                '.accordion-toggle',
-                '[aria-label*="expand" i]',
-                '[title*="expand" i]',
-                'button:has-text("Expand")',
-                'button:has-text("Show")',
-                'a:has-text("Expand")',
-                '.btn-expand'
-            ]
+            await page.evaluate(self._EXPAND_SCRIPT, self._EXPAND_SELECTORS)
             
-            for selector in expand_selectors:
-                try:
-                    elements = await page.query_selector_all(selector)
-                    for element in elements:
-                        try:
-                            if selector == 'details:not([open])':
-                                await element.set_attribute('open', '')
-                            else:
-                                await element.click(timeout=1000)
-                                await page.wait_for_timeout(500)
-                        except Exception:
-                            continue
-                except Exception:
-                    continue
-            
-            # Wait for any animations to complete
-            await page.wait_for_timeout(2000)
+            # Let content loaded by the expanders settle once, instead of per click
+            try:
+                await page.wait_for_load_state('networkidle', timeout=3000)
+            except Exception:
+                pass
             
         except Exception as e:
-            print(f"Warning: Could not expand all collapsibles: {e}")
+            logger.warning(f"Warning: Could not expand all collapsibles: {e}")
     
-    def extract_endpoint_info(self, url: str, soup: BeautifulSoup) -> Dict[str, str]:
-        """Extract endpoint method and path from the page"""
-        method = 'GET'  # default
-        endpoint = ''
+    def extract_endpoint_info(self, url: str, soup: Tag, text: Optional[str] = None) -> Dict[str, str]:
+        """Extract endpoint method and path from the page
         
-        # Look for HTTP method indicators
-        method_indicators = soup.find_all(['span', 'div', 'code', 'badge'], 
-                                        string=re.compile(r'\b(GET|POST|PUT|DELETE|PATCH|HEAD|OPTIONS)\b', re.I))
+        ``text`` is the soup's text as built by page_text(), when the caller
+        already has it; otherwise it is extracted here.
+        """
+        endpoint = ''
+        if text is None:
+            text = self.page_text(soup)
         
-        if method_indicators:
-            method_text = method_indicators[0].get_text().strip().upper()
-            for m in ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'HEAD', 'OPTIONS']:
-                if m in method_text:
-                    method = m
-                    break
+        # Look for an HTTP method token; method badges sit near the top of the page
+        match = (_METHOD_PATH_RE.search(text, 0, _METHOD_SCAN_LIMIT)
+                 or _METHOD_RE.search(text, 0, _METHOD_SCAN_LIMIT))
+        method = match.group(1).upper() if match else 'GET'
         
-        # Try to extract endpoint path
-        path_patterns = [
-            r'/api/[^"\s<>]+',
-            r'/v\d+/[^"\s<>]+',
-            r'https?://[^/]+(/[^"\s<>]+)',
-            r'[^"\s<>]*(/[a-zA-Z0-9_\-/{}]+)',
-        ]
-        
-        page_text = soup.get_text()
-        for pattern in path_patterns:
-            matches = re.findall(pattern, page_text)
-            if matches:
-                endpoint = matches[0]
-                if isinstance(endpoint, tuple):
-                    endpoint = endpoint[0]
+        # Try to extract endpoint path; path hints sit near the top of the page
+        page_text = text[:_ENDPOINT_SCAN_LIMIT]
+        for pattern in _PATH_RES:
+            match = pattern.search(page_text)
+            if match:
+                endpoint = match.group(match.lastindex or 0)
                 break
         
         # Clean up endpoint
-        endpoint = re.sub(r'[^\w\-/{}]', '', endpoint) if endpoint else 'unknown'
+        endpoint = _ENDPOINT_CLEAN_RE.sub('', endpoint) if endpoint else 'unknown'
         endpoint = endpoint.replace('/', '-').strip('-')
         
         return {'method': method, 'endpoint': endpoint}
     
-    def clean_html_content(self, soup: BeautifulSoup) -> BeautifulSoup:
-        """Clean and prepare HTML content for conversion"""
+    def clean_html_content(self, soup: BeautifulSoup, url: Optional[str] = None) -> Tag:
+        """Clean and prepare HTML content for conversion
+        
+        When ``url`` belongs to a host with a known layout, its content
+        container is used directly instead of the generic selector search.
+        """
         # Remove comments
         for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
             comment.extract()
         
-        # Remove navigation, header, footer elements
-        for selector in ['nav', 'header', 'footer', '.nav', '.navbar', '.header', '.footer', 
-                        '.sidebar', '.menu', '.breadcrumb', '.pagination', 'aside']:
-            for element in soup.select(selector):
+        # Remove navigation, header, footer, script and style elements in one pass
+        for element in soup.select(_REMOVE_SELECTOR):
+            # Nested matches are already gone once their ancestor is decomposed
+            if not element.decomposed:
                 element.decompose()
         
-        # Remove script and style tags
-        for tag in soup(['script', 'style', 'noscript']):
-            tag.decompose()
-        
-        # Try to find main content area
+        # Known hosts: go straight to their content container
         main_content = None
-        content_selectors = [
-            'main', '.content', '.main-content', '.documentation', 
-            '.api-docs', '.doc-content', 'article', '.article',
-            '#content', '#main', '#documentation'
-        ]
-        
-        for selector in content_selectors:
-            main_content = soup.select_one(selector)
-            if main_content:
-                break
+        host_match = _HOST_RE.search(urlparse(url).netloc) if url else None
+        if host_match:
+            main_content = soup.select_one(_HOST_CONTENT_SELECTORS[host_match.group(1)])
+        
+        # Try to find main content area: collect every candidate in one pass,
+        # then pick the first match of the highest-priority selector
+        candidates = soup.select(_CONTENT_SELECTOR) if main_content is None else None
+        if candidates:
+            for selector in _CONTENT_SELECTORS:
+                main_content = next((el for el in candidates if el.css.match(selector)), None)
+                if main_content:
+                    break
         
         if main_content:
-            # Create a new soup with just the main content
-            new_soup = BeautifulSoup(str(main_content), 'html.parser')
-            return new_soup
+            # The subtree is usable as-is; no need to serialize and re-parse it
+            return main_content
         
         return soup
     
@@ -159,43 +344,166 @@ class APIDocConverter:
                 base_name = f"{method}-{parsed_url.netloc.replace('.', '-')}"
         
         # Clean filename
-        base_name = re.sub(r'[^\w\-]', '-', base_name)
-        base_name = re.sub(r'-+', '-', base_name).strip('-')
+        base_name = _FILENAME_CLEAN_RE.sub('-', base_name)
+        base_name = _DASH_COLLAPSE_RE.sub('-', base_name).strip('-')
         
         return f"{base_name}.md"
     
-    async def scrape_page(self, url: str, page: Page) -> Optional[str]:
+    async def _fetch_static(self, url: str, validator: Optional[Dict[str, str]]) -> Optional[httpx.Response]:
+        """GET a page without a browser, revalidating it if ``validator`` is given
+        
+        Returns a successful or 304 Not Modified response, or None on failure.
+        Raises httpx.ConnectError if the host cannot be reached at all, after
+        recording it so no other URL on it is tried.
+        """
+        if self.http is None:
+            return None
+        try:
+            response = await self.http.get(url, headers=validator)
+            if response.status_code != 304:
+                response.raise_for_status()
+        except httpx.ConnectError:
+            self.failed_hosts.add(urlparse(url).netloc)
+            raise
+        except httpx.HTTPError:
+            return None
+        return response
+    
+    @staticmethod
+    def page_text(soup: Tag) -> str:
+        """Text of a cleaned page, for content checks and endpoint extraction
+        
+        Text only, so link and image targets never pass for the endpoint;
+        newline-joined so adjacent elements do not run together.
+        """
+        return soup.get_text('\n', strip=True)
+    
+    def _scrape_static(self, url: str, response: httpx.Response) -> Optional[Tuple[Tag, str]]:
+        """Clean a statically fetched page and extract its text
+        
+        Returns None if the page needs JavaScript to render.
+        """
+        if 'html' not in response.headers.get('content-type', ''):
+            return None
+        
+        # Hand lxml the raw bytes: it decodes them in C, honouring <meta charset>
+        # when the server did not declare one, without building response.text
+        content = response.content
+        if any(marker in content for marker in _SPA_MARKERS):
+            return None
+        
+        soup = BeautifulSoup(content, 'lxml', from_encoding=response.charset_encoding)
+        cleaned_soup = self.clean_html_content(soup, url)
+        text = self.page_text(cleaned_soup)
+        if len(text) < _MIN_STATIC_TEXT:
+            return None
+        
+        return cleaned_soup, text
+    
+    async def _scrape_dynamic(self, url: str, page: Page) -> Tag:
+        """Render a page in the browser, expanding collapsible sections"""
+        # Navigate to the page
+        try:
+            await page.goto(url, wait_until='domcontentloaded', timeout=15000)
+        except PlaywrightError as e:
+            if any(error in str(e) for error in _HOST_FAILURE_ERRORS):
+                self.failed_hosts.add(urlparse(url).netloc)
+            raise
+        
+        # Client-rendered pages usually build their content after the load event
+        # (e.g. Swagger UI fetches its spec on window.onload); let that settle
+        # before looking for anything to expand
+        try:
+            await page.wait_for_load_state('load', timeout=15000)
+            await page.wait_for_load_state('networkidle', timeout=5000)
+        except Exception:
+            pass
+        
+        # Expand collapsible sections
+        await self.expand_collapsibles(page)
+        
+        # Get page content; the browser has already decoded it, so the str goes
+        # to lxml as-is rather than being re-encoded
+        content = await page.content()
+        soup = BeautifulSoup(content, 'lxml')
+        
+        # Clean content
+        return self.clean_html_content(soup, url)
+    
+    def skip_reason(self, url: str) -> Optional[str]:
+        """Return why a URL should not be scraped at all, or None"""
+        parsed_url = urlparse(url)
+        if parsed_url.scheme not in ('http', 'https'):
+            return f"unsupported scheme '{parsed_url.scheme}'"
+        if parsed_url.path.lower().endswith(_SKIPPED_EXTENSIONS):
+            return 'not a documentation page'
+        if parsed_url.netloc in self.failed_hosts:
+            return 'host unreachable earlier in this run'
+        return None
+    
+    async def _browser_context(self) -> BrowserContext:
+        """Return the shared browser context, launching the browser on first use"""
+        async with self._browser_lock:
+            if self._context is None:
+                if self._playwright is None:
+                    self._playwright = await async_playwright().start()
+                if self._browser is None:
+                    self._browser = await self._playwright.chromium.launch(headless=True)
+                context = await self._browser.new_context(user_agent=self._USER_AGENT)
+                await context.route('**/*', self._block_heavy_resources)
+                self._context = context
+            return self._context
+    
+    async def _close_browser(self) -> None:
+        """Shut down the browser if it was started"""
+        if self._browser is not None:
+            await self._browser.close()
+        if self._playwright is not None:
+            await self._playwright.stop()
+        self._playwright = None
+        self._browser = None
+        self._context = None
+    
+    async def scrape_page(self, url: str, get_page: Callable[[], Awaitable[Page]]) -> Optional[str]:
         """Scrape a single API documentation page"""
+        reason = self.skip_reason(url)
+        if reason:
+            logger.info(f"Skipping {url}: {reason}")
+            return None
+        
         try:
-            print(f"Scraping: {url}")
-            
-            # Navigate to the page
-            await page.goto(url, wait_until='networkidle', timeout=30000)
-            
-            # Expand collapsible sections
-            await self.expand_collapsibles(page)
+            # One conditional GET both revalidates the last run's file and
+            # fetches the page for the static path
+            cached = self.cached_result(url)
+            response = await self._fetch_static(url, cached[0] if cached else None)
+            if cached and response is not None and response.status_code == 304:
+                logger.debug(f"Unchanged: {url} -> {cached[1]}")
+                return cached[1]
             
-            # Get page content
-            content = await page.content()
-            soup = BeautifulSoup(content, 'html.parser')
+            logger.debug(f"Scraping: {url}")
             
-            # Clean content
-            cleaned_soup = self.clean_html_content(soup)
-            
-            # Extract endpoint info
-            endpoint_info = self.extract_endpoint_info(url, cleaned_soup)
+            # Plain HTTP is enough for server-rendered pages; use the browser otherwise.
+            # Only static content is cached: a rendered page's HTML shell keeps its
+            # validator while the data it loads changes
+            validator = {}
+            page_text = None
+            static = self._scrape_static(url, response) if response is not None else None
+            if static is None:
+                cleaned_soup = await self._scrape_dynamic(url, await get_page())
+            else:
+                cleaned_soup, page_text = static
+                validator = self.validator_headers(response)
             
-            # Convert to markdown
-            markdown_content = markdownify.markdownify(
-                str(cleaned_soup),
-                strip=['script', 'style', 'meta', 'link', 'noscript'],
-                heading_style='ATX'
-            )
+            # Convert the cleaned tree directly rather than serializing and re-parsing it
+            markdown_content = _MARKDOWN_CONVERTER.convert_soup(cleaned_soup)
             
             # Clean up markdown
-            markdown_content = re.sub(r'\n{3,}', '\n\n', markdown_content)
+            markdown_content = _BLANKLINE_RE.sub('\n\n', markdown_content)
             markdown_content = markdown_content.strip()
             
+            # Extract endpoint info
+            endpoint_info = self.extract_endpoint_info(url, cleaned_soup, page_text)
+            
             # Add metadata header
             metadata = f"<!-- Source: {url} -->\n"
             metadata += f"<!-- Method: {endpoint_info['method']} -->\n"
@@ -205,55 +513,164 @@ class APIDocConverter:
             
             # Generate filename and save
             filename = self.generate_filename(endpoint_info['method'], endpoint_info['endpoint'], url)
-            filepath = self.output_dir / filename
-            
-            with open(filepath, 'w', encoding='utf-8') as f:
-                f.write(final_content)
+            filepath = os.path.join(self._out, filename)
             
-            print(f"Saved: {filepath}")
-            return str(filepath)
+            async with aiofiles.open(filepath, 'w', encoding='utf-8') as f:
+                await f.write(final_content)
             
         except Exception as e:
-            print(f"Error scraping {url}: {e}")
+            logger.error(f"Error scraping {url}: {e}")
             return None
+        
+        # The page is saved; cache trouble only costs the next run a re-scrape
+        if validator:
+            self.remember_result(url, validator, filepath)
+        
+        logger.debug(f"Saved: {filepath}")
+        return filepath
     
-    async def convert_urls(self, urls: List[str]) -> None:
-        """Convert multiple URLs to markdown files"""
-        async with async_playwright() as p:
-            # Launch browser
-            browser = await p.chromium.launch(headless=True)
-            context = await browser.new_context(
-                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-            )
-            page = await context.new_page()
+    async def convert_urls(self, urls: Union[Iterable[str], AsyncIterable[str]],
+                           max_concurrency: int = 5) -> int:
+        """Convert multiple URLs to markdown files
+        
+        URLs are pulled lazily from ``urls`` into a bounded queue drained by
+        ``max_concurrency`` workers, so long lists are never held in memory.
+        Returns the number of URLs processed.
+        """
+        # Pull the first URL before launching anything, so an empty list costs nothing
+        if hasattr(urls, '__aiter__'):
+            url_iter = urls.__aiter__()
+            try:
+                first_url = await url_iter.__anext__()
+            except StopAsyncIteration:
+                return 0
+        else:
+            url_iter = iter(urls)
+            first_url = next(url_iter, None)
+            if first_url is None:
+                return 0
+        
+        # Workers may need the browser at the same time; only one launches it
+        self._browser_lock = asyncio.Lock()
+        
+        # Bounded so the producer waits for the workers to catch up
+        url_queue: asyncio.Queue = asyncio.Queue(maxsize=max_concurrency * 2)
+        total_urls = 0
+        successful_conversions = 0
+        
+        # One progress update per finished URL instead of per-URL status lines;
+        # the total is only known up front for sized inputs
+        progress = tqdm(
+            total=len(urls) if hasattr(urls, '__len__') else None,
+            unit='url',
+            disable=None
+        )
+        
+        async def feed() -> None:
+            nonlocal total_urls
+            total_urls += 1
+            await url_queue.put(first_url.strip())
+            if hasattr(url_iter, '__anext__'):
+                async for url in url_iter:
+                    total_urls += 1
+                    await url_queue.put(url.strip())
+            else:
+                for url in url_iter:
+                    total_urls += 1
+                    await url_queue.put(url.strip())
+            # One stop marker per worker
+            for _ in range(max_concurrency):
+                await url_queue.put(None)
+        
+        async def worker() -> None:
+            nonlocal successful_conversions
+            # Each worker keeps one page for its whole lifetime, opened the
+            # first time one of its URLs needs the browser
+            page: Optional[Page] = None
             
-            successful_conversions = 0
-            total_urls = len(urls)
+            async def get_page() -> Page:
+                nonlocal page
+                if page is None:
+                    page = await (await self._browser_context()).new_page()
+                return page
             
-            for url in urls:
-                result = await self.scrape_page(url.strip(), page)
-                if result:
+            while True:
+                url = await url_queue.get()
+                if url is None:
+                    break
+                if await self.scrape_page(url, get_page):
                     successful_conversions += 1
-            
-            await browser.close()
-            
-            print(f"\nConversion complete!")
-            print(f"Successfully converted: {successful_conversions}/{total_urls} URLs")
-            print(f"Output directory: {self.output_dir.absolute()}")
+                progress.update()
+                # Drop the previous document but keep the page alive; pages
+                # left untouched by the static path need no navigation
+                if page is not None and page.url != 'about:blank':
+                    try:
+                        await page.goto('about:blank')
+                    except Exception:
+                        pass
+        
+        # Only reuse an existing cache here; a new one is created on first save
+        self.cache_disabled = False
+        self._open_cache(create=False)
+        self.http = httpx.AsyncClient(
+            headers={'User-Agent': self._USER_AGENT},
+            follow_redirects=True,
+            timeout=15
+        )
+        tasks = [asyncio.ensure_future(feed())]
+        tasks += [asyncio.ensure_future(worker()) for _ in range(max_concurrency)]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # If one task failed, stop the rest before the client and cache close
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            progress.close()
+            await self.http.aclose()
+            self._close_cache()
+            self.http = None
+            await self._close_browser()
+        
+        logger.info(f"\nConversion complete!")
+        logger.info(f"Successfully converted: {successful_conversions}/{total_urls} URLs")
+        logger.info(f"Output directory: {self.output_dir.absolute()}")
+        
+        return total_urls
 
 
-def read_urls_file(filepath: str) -> List[str]:
-    """Read URLs from a text file"""
-    try:
-        with open(filepath, 'r', encoding='utf-8') as f:
-            urls = [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
-        return urls
-    except FileNotFoundError:
-        print(f"Error: URLs file '{filepath}' not found.")
-        sys.exit(1)
-    except Exception as e:
-        print(f"Error reading URLs file: {e}")
-        sys.exit(1)
+async def iter_urls_file(filepath: str) -> AsyncIterator[str]:
+    """Yield URLs from a text file one at a time, skipping blanks and comments"""
+    async with aiofiles.open(filepath, 'r', encoding='utf-8') as f:
+        async for line in f:
+            url = line.strip()
+            if url and not url.startswith('#'):
+                yield url
+
+
+class TqdmHandler(logging.Handler):
+    """Log handler that prints above an active progress bar"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            tqdm.write(self.format(record), file=sys.stdout)
+        except Exception:
+            self.handleError(record)
+
+
+def setup_logging(verbose: bool = False) -> logging.handlers.QueueListener:
+    """Route log records through a queue so workers never block on stdout"""
+    log_queue = queue.SimpleQueue()
+    handler = TqdmHandler()
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    logger.setLevel(logging.DEBUG if verbose else logging.INFO)
+    logger.propagate = False
+    
+    listener = logging.handlers.QueueListener(log_queue, handler)
+    listener.start()
+    return listener
 
 
 def main():
@@ -274,32 +691,49 @@ Examples:
     
     parser.add_argument('--output', type=str, default='./output', 
                        help='Output directory for markdown files (default: ./output)')
+    parser.add_argument('--max-concurrency', type=int, default=5,
+                       help='Maximum number of pages scraped in parallel (default: 5)')
+    parser.add_argument('--cache', type=str, default=_DEFAULT_CACHE_PATH,
+                       help=f'Path of the cache of unchanged pages (default: {_DEFAULT_CACHE_PATH})')
+    parser.add_argument('--verbose', action='store_true',
+                       help='Log every scraped and saved URL')
     
     args = parser.parse_args()
     
-    # Get URLs
+    if args.max_concurrency < 1:
+        parser.error('--max-concurrency must be at least 1')
+    
+    # Get URLs; a file is streamed rather than loaded up front
     if args.urls:
-        urls = read_urls_file(args.urls)
+        if not os.path.isfile(args.urls):
+            print(f"Error: URLs file '{args.urls}' not found.")
+            sys.exit(1)
+        urls = iter_urls_file(args.urls)
+        print(f"Reading URLs from {args.urls}")
     else:
         urls = [args.url]
-    
-    if not urls:
-        print("Error: No URLs to process.")
-        sys.exit(1)
-    
-    print(f"Found {len(urls)} URL(s) to process")
+        print(f"Found {len(urls)} URL(s) to process")
     
     # Create converter and run
-    converter = APIDocConverter(args.output)
+    converter = APIDocConverter(args.output, args.cache)
+    listener = setup_logging(args.verbose)
     
     try:
-        asyncio.run(converter.convert_urls(urls))
+        try:
+            total_urls = asyncio.run(converter.convert_urls(urls, args.max_concurrency))
+        finally:
+            # Flush queued log records before any final message
+            listener.stop()
     except KeyboardInterrupt:
         print("\nConversion interrupted by user.")
         sys.exit(1)
     except Exception as e:
         print(f"Error during conversion: {e}")
         sys.exit(1)
+    
+    if not total_urls:
+        print("Error: No URLs to process.")
+        sys.exit(1)
 
 
 if __name__ == '__main__':